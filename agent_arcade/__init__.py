@@ -1,45 +1,67 @@
 """Agent Arcade - Play games while AI agents think."""
 
+import functools
+import re
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-import re
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None
 
 _POETRY_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"\s*$')
 
 
+def _scan_pyproject_version(text: str) -> str | None:
+    """Line-scan fallback for Pythons without tomllib."""
+    in_poetry = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped == "[tool.poetry]":
+            in_poetry = True
+            continue
+        if in_poetry and stripped.startswith("[") and stripped.endswith("]"):
+            break
+        if not in_poetry:
+            continue
+        match = _POETRY_VERSION_RE.match(stripped)
+        if match:
+            return match.group(1)
+    return None
+
+
 def _read_pyproject_version() -> str | None:
     pyproject = Path(__file__).resolve().parents[1] / "pyproject.toml"
     if not pyproject.exists():
         return None
 
-    in_poetry = False
     try:
-        for line in pyproject.read_text().splitlines():
-            stripped = line.strip()
-            if stripped == "[tool.poetry]":
-                in_poetry = True
-                continue
-            if in_poetry and stripped.startswith("[") and stripped.endswith("]"):
-                break
-            if not in_poetry:
-                continue
-            match = _POETRY_VERSION_RE.match(stripped)
-            if match:
-                return match.group(1)
+        text = pyproject.read_text()
     except OSError:
         return None
-    return None
+
+    if tomllib is not None:
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            return None
+        return (
+            data.get("tool", {}).get("poetry", {}).get("version")
+            or data.get("project", {}).get("version")
+        )
+    return _scan_pyproject_version(text)
 
 
+@functools.cache
 def _resolve_version() -> str:
-    local_version = _read_pyproject_version()
-    if local_version:
-        return local_version
+    # Installed metadata first: the in-memory lookup avoids the pyproject
+    # stat/read/scan on the common installed path
     try:
         return version("agent-arcade")
     except PackageNotFoundError:
-        return "0+dev"
+        pass
+    return _read_pyproject_version() or "0+dev"
 
 
 __version__ = _resolve_version()
@@ -8,6 +8,53 @@ from pathlib import Path
 from typing import Callable, List, Optional, Pattern, Tuple
 
 
+def strip_ansi_fast(text: str) -> str:
+    """
+    Remove ANSI escape sequences with a single O(n) pass.
+
+    Walks the string once with `str.find`, copying the plain substrings
+    between escape runs and skipping CSI (ESC [ params intermediates final)
+    and two-byte ESC-letter sequences by index arithmetic. Much cheaper
+    than a regex pass on the multi-KB captures the monitor loops process.
+
+    Args:
+        text: Text potentially containing ANSI codes
+
+    Returns:
+        Text with ANSI codes removed
+    """
+    if '\x1b' not in text and '\x9b' not in text:
+        return text
+
+    parts = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        esc = text.find('\x1b', pos)
+        if esc == -1:
+            parts.append(text[pos:])
+            break
+        parts.append(text[pos:esc])
+        i = esc + 1
+        if i >= length:
+            break
+        ch = text[i]
+        if ch == '[':
+            # CSI: parameter bytes [0-?], intermediate bytes [ -/], final [@-~]
+            i += 1
+            while i < length and '0' <= text[i] <= '?':
+                i += 1
+            while i < length and ' ' <= text[i] <= '/':
+                i += 1
+            if i < length:
+                i += 1
+        elif '@' <= ch <= '_':
+            # Two-byte ESC-letter sequence (e.g. ESC M, ESC ])
+            i += 1
+        pos = i
+    return ''.join(parts)
+
+
 @dataclass
 class AgentStatus:
     """Current status of an AI agent."""
@@ -31,6 +78,12 @@ class BaseAgent(ABC):
         self.config = config
         self.ready_patterns: List[Pattern] = self._compile_patterns()
 
+        # Single alternation over all ready patterns so check_ready scans
+        # the output once instead of once per pattern
+        self._ready_union: Optional[Pattern] = None
+        self._union_group_map: dict = {}
+        self._compile_union()
+
         # State change callback
         # Called with is_idle parameter when state changes
         self.on_state_change: Optional[Callable[[bool], None]] = None
@@ -50,6 +103,32 @@ class BaseAgent(ABC):
                 print(f"Warning: Invalid pattern '{pattern_str}': {e}")
         return patterns
 
+    def _compile_union(self) -> None:
+        """
+        Combine all ready patterns into one alternation.
+
+        Each pattern gets its own outer group; the group index maps back to
+        the original pattern so matched_pattern can still be reported.
+        Falls back to the per-pattern loop if the combined form won't compile.
+        """
+        if not self.ready_patterns:
+            return
+
+        group_index = 1
+        group_map = {}
+        parts = []
+        for pattern in self.ready_patterns:
+            group_map[group_index] = pattern
+            parts.append(f"({pattern.pattern})")
+            # Account for capture groups inside the pattern itself
+            group_index += pattern.groups + 1
+
+        try:
+            self._ready_union = re.compile("|".join(parts), re.MULTILINE)
+            self._union_group_map = group_map
+        except re.error:
+            self._ready_union = None
+
     def check_ready(self, output: str) -> AgentStatus:
         """
         Check if agent is ready based on output.
@@ -60,16 +139,32 @@ class BaseAgent(ABC):
         Returns:
             AgentStatus indicating readiness
         """
-        # Check against ready patterns
-        for pattern in self.ready_patterns:
-            match = pattern.search(output)
+        # Single-pass check against the combined alternation
+        if self._ready_union is not None:
+            match = self._ready_union.search(output)
             if match:
+                matched = ""
+                for index, pattern in self._union_group_map.items():
+                    if match.start(index) != -1:
+                        matched = pattern.pattern
+                        break
                 return AgentStatus(
                     is_ready=True,
                     confidence=1.0,
                     last_output_time=time.time(),
-                    matched_pattern=pattern.pattern
+                    matched_pattern=matched
                 )
+        else:
+            # Fallback: check each pattern individually
+            for pattern in self.ready_patterns:
+                match = pattern.search(output)
+                if match:
+                    return AgentStatus(
+                        is_ready=True,
+                        confidence=1.0,
+                        last_output_time=time.time(),
+                        matched_pattern=pattern.pattern
+                    )
 
         # No pattern matched
         return AgentStatus(
@@ -7,7 +7,7 @@ import time
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from .base import BaseAgent
+from .base import BaseAgent, strip_ansi_fast
 
 
 class CodexAgent(BaseAgent):
@@ -73,16 +73,20 @@ class CodexAgent(BaseAgent):
         self._running = False
         self._monitor_thread = None
         self._last_position = 0
-        self._last_activity = time.time()
+        self._last_activity = time.monotonic()
         self._session_dir = Path.home() / ".codex" / "sessions"
         self._session_file: Optional[Path] = None
         self._session_last_position = 0
-        self._session_last_activity = time.time()
+        self._session_last_activity = time.monotonic()
         self._tmux_last_output = ""
+        self._tmux_last_clean = ""
         self._tmux_missing_since: Optional[float] = None
         self._tmux_marker_seen = False
         self.tmux = None
         self.buffer_lines = 50
+        # The activity marker sits in the last few lines, so only the tail
+        # of the capture is stripped and scanned
+        self.max_scan_chars = 4096
 
     def set_tmux_manager(self, tmux_manager) -> None:
         """
@@ -190,7 +194,14 @@ class CodexAgent(BaseAgent):
     @classmethod
     def _strip_ansi_codes(cls, text: str) -> str:
         """Remove ANSI escape sequences from text."""
-        return cls.ANSI_ESCAPE.sub('', text)
+        # Fast path: plain output (no ESC/CSI bytes) needs no regex pass
+        if '\x1b' not in text and '\x9b' not in text:
+            return text
+        stripped = strip_ansi_fast(text)
+        if '\x1b' in stripped:
+            # Fall back to the regex for anything the fast path missed
+            stripped = cls.ANSI_ESCAPE.sub('', stripped)
+        return stripped
 
     def _monitor_tmux_output(self) -> bool:
         """Monitor tmux pane for the Codex activity indicator."""
@@ -205,15 +216,20 @@ class CodexAgent(BaseAgent):
         try:
             output = self.tmux.capture_window_output(
                 self.tmux.ai_window_index,
-                lines=self.buffer_lines
+                lines=self.buffer_lines,
+                tail_bytes=self.max_scan_chars
             )
         except Exception:
             return False
         if output != self._tmux_last_output:
             self._tmux_last_output = output
+            self._tmux_last_clean = self._strip_ansi_codes(
+                output[-self.max_scan_chars:]
+            ).lower()
 
-        clean_output = self._strip_ansi_codes(output).lower()
-        now = time.time()
+        # Unchanged buffer: reuse the cached stripped/lowered text
+        clean_output = self._tmux_last_clean
+        now = time.monotonic()
 
         if self.ESC_INTERRUPT_MARKER in clean_output:
             self._last_activity = now
@@ -258,7 +274,7 @@ class CodexAgent(BaseAgent):
                 lines = handle.read().splitlines()
                 self._session_last_position = handle.tell()
 
-        now = time.time()
+        now = time.monotonic()
         active_seen = False
         idle_seen = False
         for line in lines:
@@ -313,7 +329,7 @@ class CodexAgent(BaseAgent):
                 lines = handle.read().splitlines()
                 self._last_position = handle.tell()
 
-        now = time.time()
+        now = time.monotonic()
         active_seen = False
         idle_seen = False
         for line in lines:
@@ -1,11 +1,16 @@
 """Generic agent implementation with pattern-based detection."""
 
+import os
 import re
+import select
+import shlex
+import tempfile
 import threading
 import time
+from pathlib import Path
 from typing import List, Optional, Tuple, TYPE_CHECKING
 
-from .base import BaseAgent
+from .base import BaseAgent, strip_ansi_fast
 
 if TYPE_CHECKING:
     from ..tmux_manager import TmuxManager
@@ -41,8 +46,26 @@ class GenericAgent(BaseAgent):
         self._is_idle = True
         self._running = False
         self._monitor_thread = None
-        self._last_output = ""
-        self._last_change_time = time.time()
+        self._last_output = b""
+        self._last_change_time = time.monotonic()
+        # Consecutive polling ticks with no output change (debounce signal)
+        self._silent_ticks = 0
+
+        # Cached results for the last captured buffer; valid while the
+        # raw output is unchanged between ticks (the common idle case)
+        self._cached_clean = ""
+        self._cached_status = None
+
+        # Ready prompts live in the last few lines, so only the tail of the
+        # capture is stripped and matched
+        self.max_scan_chars = 4096
+
+        # Event-driven pipe-pane reader (preferred over polling capture).
+        # The buffer is a reused bytearray ring; only the tail is decoded.
+        self.max_buffer_bytes = 8192
+        self._pipe_path: Optional[Path] = None
+        self._pipe_fd: Optional[int] = None
+        self._pipe_buffer = bytearray()
 
     def set_tmux_manager(self, tmux_manager: 'TmuxManager') -> None:
         """
@@ -67,8 +90,12 @@ class GenericAgent(BaseAgent):
         if self._running or not self.tmux:
             return
 
+        # Prefer the event-driven pipe reader; fall back to polling capture
+        # when pipe-pane is unavailable (e.g. old tmux).
+        target = self._pipe_loop if self._setup_pipe() else self._monitor_loop
+
         self._running = True
-        self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._monitor_thread = threading.Thread(target=target, daemon=True)
         self._monitor_thread.start()
 
     def stop_detection(self) -> None:
@@ -76,6 +103,7 @@ class GenericAgent(BaseAgent):
         self._running = False
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
+        self._teardown_pipe()
 
     def get_current_state(self) -> bool:
         """
@@ -86,6 +114,136 @@ class GenericAgent(BaseAgent):
         """
         return self._is_idle
 
+    def _set_idle(self, is_idle: bool) -> None:
+        """Update idle state and notify if changed."""
+        if is_idle != self._is_idle:
+            self._is_idle = is_idle
+            if self.on_state_change:
+                self.on_state_change(self._is_idle)
+
+    def _setup_pipe(self) -> bool:
+        """
+        Redirect new pane output into a FIFO via tmux pipe-pane.
+
+        Returns:
+            True if the pipe reader can be used
+        """
+        path = Path(tempfile.gettempdir()) / f"agent-arcade-pipe-{os.getpid()}.fifo"
+        try:
+            if path.exists():
+                path.unlink()
+            os.mkfifo(path)
+            # Open read end first (non-blocking) so the writer can attach
+            self._pipe_fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            self._pipe_path = path
+            self.tmux.pipe_window_output(
+                self.tmux.ai_window_index,
+                f"cat >> {shlex.quote(str(path))}"
+            )
+            return True
+        except Exception:
+            self._teardown_pipe()
+            return False
+
+    def _teardown_pipe(self) -> None:
+        """Stop the pane pipe and remove the FIFO."""
+        if self.tmux and self._pipe_path:
+            self.tmux.stop_window_pipe(self.tmux.ai_window_index)
+        if self._pipe_fd is not None:
+            try:
+                os.close(self._pipe_fd)
+            except OSError:
+                pass
+            self._pipe_fd = None
+        if self._pipe_path:
+            try:
+                self._pipe_path.unlink()
+            except OSError:
+                pass
+            self._pipe_path = None
+
+    def _pipe_loop(self) -> None:
+        """Event-driven monitor: wake only when the pane produces output."""
+        # Seed with the current screen so a prompt printed before detection
+        # started still matches.
+        try:
+            self._pipe_buffer = bytearray(self.tmux.capture_window_bytes(
+                self.tmux.ai_window_index,
+                lines=self.buffer_lines
+            ))
+        except Exception:
+            self._pipe_buffer = bytearray()
+        self._process_pipe_buffer()
+
+        while self._running:
+            try:
+                readable, _, _ = select.select(
+                    [self._pipe_fd], [], [], self.inactivity_timeout / 2
+                )
+                if readable:
+                    chunk = os.read(self._pipe_fd, 65536)
+                    if chunk:
+                        self._pipe_buffer.extend(chunk)
+                        # Trim in place to keep the ring bounded
+                        overflow = len(self._pipe_buffer) - self.max_buffer_bytes
+                        if overflow > 0:
+                            del self._pipe_buffer[:overflow]
+                        self._last_change_time = time.monotonic()
+                        self._process_pipe_buffer()
+                        continue
+
+                    # Empty read means EOF: the pipe-pane writer exited
+                    # (e.g. the pane was respawned). An EOF'd FIFO stays
+                    # readable forever, so rebuild the pipe instead of
+                    # spinning on select; fall back to polling if that
+                    # fails.
+                    self._teardown_pipe()
+                    if not self._running:
+                        return
+                    if not self._setup_pipe():
+                        self._monitor_loop()
+                        return
+                    continue
+
+                # Silence: declare idle once the inactivity timeout elapses
+                if not self._is_idle:
+                    time_since_change = time.monotonic() - self._last_change_time
+                    if time_since_change >= self.inactivity_timeout:
+                        self._set_idle(True)
+
+            except Exception as e:
+                # Don't crash the monitor thread on errors
+                print(f"Pattern monitor error: {e}")
+                time.sleep(self.check_interval)
+
+    def _process_pipe_buffer(self) -> None:
+        """Run ready patterns against the tail of the buffered pipe output."""
+        tail = bytes(self._pipe_buffer[-self.max_scan_chars:])
+        clean_output = self._strip_ansi_codes(tail.decode("utf-8", "replace"))
+        is_ready = self.check_ready(clean_output).is_ready
+        if is_ready:
+            # The ring buffers a stream, not the screen: a ready prompt
+            # stays in it after the agent goes active and would keep
+            # matching until enough new output evicts it. Confirm every
+            # ready match against the current screen, where the prompt
+            # disappears as soon as the agent resumes.
+            try:
+                screen = self.tmux.capture_window_bytes(
+                    self.tmux.ai_window_index,
+                    lines=self.buffer_lines
+                )
+            except Exception:
+                return
+            clean_screen = self._strip_ansi_codes(
+                screen[-self.max_scan_chars:].decode("utf-8", "replace")
+            )
+            is_ready = self.check_ready(clean_screen).is_ready
+            if not is_ready:
+                # Stale prompt: resync the ring to the screen so it
+                # stops re-matching on every subsequent chunk
+                self._pipe_buffer = bytearray(screen[-self.max_buffer_bytes:])
+        self._set_idle(is_ready)
+
     @classmethod
     def _strip_ansi_codes(cls, text: str) -> str:
         """
@@ -97,45 +255,55 @@ class GenericAgent(BaseAgent):
         Returns:
             Text with ANSI codes removed
         """
-        return cls.ANSI_ESCAPE.sub('', text)
+        # Fast path: plain output (no ESC/CSI bytes) needs no regex pass
+        if '\x1b' not in text and '\x9b' not in text:
+            return text
+        stripped = strip_ansi_fast(text)
+        if '\x1b' in stripped:
+            # Fall back to the regex for anything the fast path missed
+            stripped = cls.ANSI_ESCAPE.sub('', stripped)
+        return stripped
 
     def _monitor_loop(self) -> None:
         """Monitor terminal output for pattern matches (runs in thread)."""
         while self._running:
             try:
-                # Capture recent output from AI window
-                output = self.tmux.capture_window_output(
+                # Capture recent output from AI window (raw bytes; the
+                # change comparison doesn't need a decode)
+                output = self.tmux.capture_window_bytes(
                     self.tmux.ai_window_index,
                     lines=self.buffer_lines
                 )
 
                 # Check if output has changed
-                if output != self._last_output:
+                if output != self._last_output or self._cached_status is None:
                     self._last_output = output
-                    self._last_change_time = time.time()
+                    self._silent_ticks = 0
 
-                # Strip ANSI codes before pattern matching
-                clean_output = self._strip_ansi_codes(output)
+                    # Decode and strip only the tail before pattern matching
+                    tail = output[-self.max_scan_chars:].decode("utf-8", "replace")
+                    self._cached_clean = self._strip_ansi_codes(tail)
 
-                # Check agent-specific ready patterns
-                status = self.check_ready(clean_output)
+                    # Check agent-specific ready patterns
+                    self._cached_status = self.check_ready(self._cached_clean)
+                else:
+                    # Unchanged buffer: reuse the cached strip/match results
+                    self._silent_ticks += 1
+
+                status = self._cached_status
 
                 # Determine state: idle or active
                 is_idle = status.is_ready
 
-                # If no pattern matched, check inactivity timeout as fallback
+                # If no pattern matched, debounce on consecutive silent ticks
+                # instead of wall-clock arithmetic
                 if not is_idle:
-                    time_since_change = time.time() - self._last_change_time
-                    if time_since_change >= self.inactivity_timeout:
+                    silence = self._silent_ticks * self.check_interval
+                    if silence >= self.inactivity_timeout:
                         is_idle = True
 
                 # Update state and notify if changed
-                if is_idle != self._is_idle:
-                    self._is_idle = is_idle
-
-                    # Call callback if set
-                    if self.on_state_change:
-                        self.on_state_change(self._is_idle)
+                self._set_idle(is_idle)
 
                 # Sleep until next check
                 time.sleep(self.check_interval)
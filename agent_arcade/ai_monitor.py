@@ -1,7 +1,7 @@
 """AI agent output monitoring."""
 
+import asyncio
 import threading
-import time
 from typing import Callable, Optional
 
 from .agents.base import BaseAgent
@@ -47,9 +47,11 @@ class AIMonitor:
         # Start agent's own detection mechanism
         self.agent.start_detection()
 
-        # Start game monitoring thread
+        # Run the game monitor as a single asyncio task; the thread only
+        # hosts the event loop so tmux.attach() can still block the main
+        # thread.
         self._running = True
-        self._thread = threading.Thread(target=self._monitor_game_loop, daemon=True)
+        self._thread = threading.Thread(target=self._run_monitor_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
@@ -77,22 +79,31 @@ class AIMonitor:
         if self.on_state_changed:
             self.on_state_changed(is_idle)
 
-    def _monitor_game_loop(self) -> None:
-        """Monitor game window for current game (runs in thread)."""
+    def _run_monitor_loop(self) -> None:
+        """Host the asyncio game monitor in its own event loop."""
+        asyncio.run(self._monitor_game_async())
+
+    async def _monitor_game_async(self) -> None:
+        """Monitor game window for current game (single asyncio task)."""
         while self._running:
             try:
-                self._monitor_game_status()
-                time.sleep(self.check_interval)
+                await self._check_game_status()
+                await asyncio.sleep(self.check_interval)
             except Exception as e:
-                # Don't crash the monitor thread on errors
+                # Don't crash the monitor task on errors
                 print(f"Game monitor error: {e}")
-                time.sleep(self.check_interval)
+                await asyncio.sleep(self.check_interval)
 
-    def _monitor_game_status(self) -> None:
-        """Monitor game window to detect current game."""
+    async def _check_game_status(self) -> None:
+        """Read the current game from tmux without blocking the loop."""
         try:
             # Read game name from tmux session option (set by game runner).
-            current_game = self.tmux.get_session_option("@current-game")
+            # The query rides the manager's persistent control-mode pipe
+            # instead of forking a tmux client; to_thread keeps the
+            # blocking read off the event loop.
+            current_game = await asyncio.to_thread(
+                self.tmux.get_session_option, "@current-game"
+            )
 
             # Update status bar if game changed
             if current_game != self.tmux.current_game:
@@ -2,6 +2,7 @@
 
 import atexit
 import os
+import select
 import signal
 import subprocess
 import sys
@@ -10,8 +11,6 @@ import time
 import tempfile
 from pathlib import Path
 
-from .agents import create_agent
-from .ai_monitor import AIMonitor
 from .config import Config
 from .tmux_manager import TmuxManager
 
@@ -68,22 +67,23 @@ def check_version():
         pass
 
 
-def print_help(config: Config):
+_USAGE = """\
+Agent Arcade - AI coding agents with games for waiting
+
+Usage:
+  agent-arcade
+
+Options:
+  -h, --help   Show this help message and exit
+
+When you run agent-arcade, you'll see a menu to select your AI agent.
+After selecting an agent, switch to the games window with Ctrl+Space.
+Press Ctrl+X to exit anytime."""
+
+
+def print_help():
     """Print CLI help/usage information."""
-    usage = [
-        "Agent Arcade - AI coding agents with games for waiting",
-        "",
-        "Usage:",
-        "  agent-arcade",
-        "",
-        "Options:",
-        "  -h, --help   Show this help message and exit",
-        "",
-        "When you run agent-arcade, you'll see a menu to select your AI agent.",
-        "After selecting an agent, switch to the games window with Ctrl+Space.",
-        "Press Ctrl+X to exit anytime.",
-    ]
-    print("\n".join(usage))
+    print(_USAGE)
 
 
 def check_tmux_installed():
@@ -112,6 +112,11 @@ def check_tmux_installed():
 
 def main():
     """Main entry point for agent-arcade command."""
+    # Show help before any tmux/version/config work
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help", "help"):
+        print_help()
+        sys.exit(0)
+
     # Set terminal title
     print("\033]0;Agent Arcade\007", end="", flush=True)
 
@@ -125,11 +130,6 @@ def main():
         # Load configuration
         config = Config.load()
 
-        # Show help early
-        if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help", "help"):
-            print_help(config)
-            sys.exit(0)
-
         # Launch with agent menu + Games
         run_with_agent_menu(config)
 
@@ -141,6 +141,31 @@ def main():
         sys.exit(1)
 
 
+def _wait_for_pane_event(event_fd, timeout: float = 5.0) -> None:
+    """
+    Block until the pane-died hook fires or the safety-net timeout elapses.
+
+    Falls back to a plain 1-second sleep when the event FIFO could not be
+    registered (e.g. old tmux without set-hook).
+
+    Args:
+        event_fd: FIFO file descriptor from register_pane_died_event, or None
+        timeout: Safety-net poll interval in seconds
+    """
+    if event_fd is None:
+        time.sleep(1.0)
+        return
+    try:
+        readable, _, _ = select.select([event_fd], [], [], timeout)
+        if readable:
+            data = os.read(event_fd, 4096)  # Drain the event marker
+            if not data:
+                # EOF'd FIFO stays readable forever; don't busy-loop
+                time.sleep(1.0)
+    except (OSError, ValueError):
+        time.sleep(1.0)
+
+
 def run_with_agent(config, agent_selector: str):
     """
     Run dual-pane mode with AI agent and games.
@@ -149,6 +174,10 @@ def run_with_agent(config, agent_selector: str):
         config: Config instance
         agent_selector: Agent selector (id or name, e.g., "codex")
     """
+    # Deferred imports: only this path needs the agent machinery
+    from .agents import create_agent
+    from .ai_monitor import AIMonitor
+
     # Get agent configuration
     agent_config = config.resolve_agent(agent_selector)
     if not agent_config:
@@ -199,6 +228,8 @@ def run_with_agent(config, agent_selector: str):
 
     def start_pane_monitor():
         """Restart panes if they exit unexpectedly."""
+        event_fd = tmux.register_pane_died_event()
+
         def monitor():
             ai_failures = 0
             game_failures = 0
@@ -230,7 +261,7 @@ def run_with_agent(config, agent_selector: str):
                         tmux.kill_session()
                     finally:
                         sys.exit(1)
-                time.sleep(1.0)
+                _wait_for_pane_event(event_fd)
 
         nonlocal monitor_thread
         monitor_thread = threading.Thread(target=monitor, daemon=True)
@@ -326,6 +357,8 @@ def run_with_agent_menu(config):
 
     def start_game_pane_monitor():
         """Restart game pane if it exits unexpectedly."""
+        event_fd = tmux.register_pane_died_event()
+
         def monitor():
             game_failures = 0
             while not stop_event.is_set():
@@ -348,7 +381,7 @@ def run_with_agent_menu(config):
                         tmux.kill_session()
                     finally:
                         sys.exit(1)
-                time.sleep(1.0)
+                _wait_for_pane_event(event_fd)
 
         nonlocal monitor_thread
         monitor_thread = threading.Thread(target=monitor, daemon=True)
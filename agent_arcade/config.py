@@ -103,6 +103,10 @@ class KeybindingsConfig:
     exit_app: str = "C-x"  # Ctrl+x to exit application
 
 
+# Process-wide cached Config instance (built once per entrypoint)
+_loaded_config: Optional["Config"] = None
+
+
 class Config:
     """Main configuration class for Agent Arcade."""
 
@@ -129,13 +133,19 @@ class Config:
         """
         Load configuration from built-in defaults.
 
+        The result is cached for the process so repeated entrypoint calls
+        (status updates, selector transitions) reuse one instance.
+
         Args:
             config_path: Unused (kept for compatibility).
 
         Returns:
             Config instance
         """
-        return cls.from_dict(cls.get_default_config())
+        global _loaded_config
+        if _loaded_config is None:
+            _loaded_config = cls.from_dict(cls.get_default_config())
+        return _loaded_config
 
     @staticmethod
     def get_default_config() -> Dict[str, Any]:
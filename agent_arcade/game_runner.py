@@ -8,10 +8,8 @@ from textual.app import App, ComposeResult
 from textual.widgets import Header
 
 from .config import Config
-from .game_library import GameLibrary
 from .games.base_game import BaseGame, GameEvent, GameState
 from .logger import logger
-from .ui.game_selector import GameSelectorScreen
 
 
 def _set_tmux_game_keys(config: Config, bindings) -> None:
@@ -166,6 +164,10 @@ class GameRunnerApp(App):
             config: Config instance
         """
         super().__init__()
+        # Deferred imports: loading the library pulls in every game module
+        from .game_library import GameLibrary
+        from .ui.game_selector import GameSelectorScreen
+
         self.config = config
         self.library = GameLibrary()
         self.menu_screen = GameSelectorScreen(self.library)
@@ -1,9 +1,16 @@
 """tmux session management for Agent Arcade."""
 
+import functools
+import os
 import platform
+import select
 import shlex
+import shutil
+import string
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import List, Optional
@@ -11,6 +18,277 @@ from typing import List, Optional
 from .config import get_data_dir
 from .logger import logger
 
+# Local binding skips the module-attribute lookup on every call in the
+# subprocess-heavy paths below
+_run = subprocess.run
+
+# Characters that need no quoting for the tmux command parser
+_TMUX_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "-_./:=,@+")
+
+# Shared kwargs for one-shot tmux subprocesses. close_fds=False skips the
+# post-fork walk over the whole RLIMIT_NOFILE table (expensive with the
+# high fd limits common in containers) — tmux inherits no descriptors it
+# should not see. stdin comes from /dev/null so tmux never blocks on it.
+_TMUX_RUN_KW = dict(
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    close_fds=False,
+)
+_TMUX_CAPTURE_KW = dict(
+    stdin=subprocess.DEVNULL,
+    capture_output=True,
+    close_fds=False,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _tmux_bin() -> Optional[str]:
+    """Resolve the tmux binary path once per process."""
+    return shutil.which("tmux")
+
+
+def _spawn_tmux_and_wait(args: List[str]) -> None:
+    """
+    Run a tmux command via posix_spawn, discarding its output.
+
+    posix_spawn skips the parent's page-table copy that fork pays, so
+    fire-and-forget commands (set-option and friends) get markedly
+    cheaper than subprocess.run when no output is needed.
+
+    Args:
+        args: Command arguments (without the leading "tmux")
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits nonzero
+        FileNotFoundError: If tmux is not on PATH
+    """
+    tmux = _tmux_bin()
+    if tmux is None:
+        raise FileNotFoundError("tmux")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    try:
+        pid = os.posix_spawn(
+            tmux,
+            ["tmux"] + args,
+            dict(os.environ),
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, devnull, 0),
+                (os.POSIX_SPAWN_DUP2, devnull, 1),
+                (os.POSIX_SPAWN_DUP2, devnull, 2),
+            ],
+        )
+    finally:
+        os.close(devnull)
+    _, status = os.waitpid(pid, 0)
+    code = os.waitstatus_to_exitcode(status)
+    if code != 0:
+        raise subprocess.CalledProcessError(code, ["tmux"] + args)
+
+
+def _tmux_argv(args: List[str]) -> List[str]:
+    """
+    Build a tmux argv with an absolute argv[0].
+
+    CPython only takes its posix_spawn fast path when the executable has
+    a directory component (plus close_fds=False, no preexec_fn/cwd), so
+    spelling out the resolved path keeps one-shot calls off the slower
+    fork+exec route.
+
+    Args:
+        args: Command arguments (without the leading "tmux")
+
+    Returns:
+        Full argv including the tmux binary path
+    """
+    return [_tmux_bin() or "tmux"] + args
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_dev_python() -> Optional[str]:
+    """
+    Resolve the dev virtualenv's python interpreter once per process.
+
+    Checks VIRTUAL_ENV first, then asks poetry for its venv path, so
+    pane commands can exec the interpreter directly instead of paying
+    poetry's bootstrap on every (re)launch.
+
+    Returns:
+        Path to the venv's python, or None if it cannot be resolved
+    """
+    venv = os.environ.get("VIRTUAL_ENV")
+    if not venv:
+        try:
+            result = _run(
+                ["poetry", "env", "info", "-p"],
+                text=True, check=True, timeout=10, **_TMUX_CAPTURE_KW
+            )
+            venv = result.stdout.strip()
+        except Exception:
+            return None
+    python = os.path.join(venv, "bin", "python")
+    return python if venv and os.path.exists(python) else None
+
+
+def _quote_tmux_arg(arg: str) -> str:
+    """Quote a single argument for the tmux control-mode command line."""
+    if arg and all(c in _TMUX_SAFE_CHARS for c in arg):
+        return arg
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+class _ControlModeClient:
+    """
+    Persistent tmux control-mode (-C) client.
+
+    Commands are written to the client's stdin and replies come back
+    framed by %begin/%end (or %error) lines, so repeated tmux operations
+    reuse one long-lived process instead of paying a fork/exec each.
+    """
+
+    def __init__(self, session_name: str, timeout: float = 5.0):
+        # no-output stops tmux streaming %output notifications for every
+        # pane: nothing drains this client between commands, so pane
+        # output would otherwise pile up in the pipe and the server's
+        # client buffer without bound. On tmux without -f the attach
+        # fails and callers fall back to one-shot clients.
+        self._proc = subprocess.Popen(
+            _tmux_argv([
+                "-C", "attach-session", "-t", session_name, "-f", "no-output"
+            ]),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            close_fds=False,
+        )
+        self._buf = b""
+        self._lock = threading.Lock()
+        self.timeout = timeout
+        # Consume the guard reply tmux emits when a control client connects
+        self._read_reply()
+
+    def alive(self) -> bool:
+        """Return True while the control client process is running."""
+        return self._proc.poll() is None
+
+    def run(self, args: List[str]) -> str:
+        """
+        Run one tmux command through the pipe.
+
+        Args:
+            args: tmux command arguments (without the leading "tmux")
+
+        Returns:
+            Command output (reply block body)
+
+        Raises:
+            subprocess.CalledProcessError: If tmux reports an error
+        """
+        return self.run_lines([" ".join(_quote_tmux_arg(a) for a in args)], args)
+
+    def run_lines(
+        self,
+        lines: List[str],
+        args: Optional[List[str]] = None
+    ) -> str:
+        """
+        Run several pre-quoted tmux command lines in one write.
+
+        Each line gets exactly one %begin/%end (or %error) reply, even
+        when it fails to parse — unlike ';'-joined commands on one line,
+        where a parse error collapses the whole line into a single
+        %error block and a runtime error stops the sequence, either of
+        which would desynchronise reply counting.
+
+        Args:
+            lines: Command lines as the tmux parser should see them
+            args: Original arguments, for error reporting
+
+        Returns:
+            Command output (reply block bodies joined with newlines)
+
+        Raises:
+            subprocess.CalledProcessError: If tmux reports an error
+        """
+        with self._lock:
+            self._proc.stdin.write("".join(l + "\n" for l in lines).encode())
+            self._proc.stdin.flush()
+            outputs: List[str] = []
+            failed = False
+            # Drain every reply block even after an error so later
+            # commands don't read a stale block
+            for _ in lines:
+                try:
+                    outputs.append(self._read_reply())
+                except subprocess.CalledProcessError as exc:
+                    failed = True
+                    if exc.output:
+                        outputs.append(exc.output)
+            output = "\n".join(o for o in outputs if o)
+            if failed:
+                raise subprocess.CalledProcessError(
+                    1, ["tmux"] + (args if args is not None else lines),
+                    output=output
+                )
+            return output
+
+    def close(self) -> None:
+        """Detach the control client."""
+        try:
+            if self._proc.poll() is None:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1.0)
+        except Exception:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+
+    def _readline(self) -> str:
+        """Read one line from the client with a timeout."""
+        deadline = time.monotonic() + self.timeout
+        while b"\n" not in self._buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("tmux control client timed out")
+            readable, _, _ = select.select([self._proc.stdout], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(self._proc.stdout.fileno(), 65536)
+            if not chunk:
+                raise RuntimeError("tmux control client closed")
+            self._buf += chunk
+        line, _, self._buf = self._buf.partition(b"\n")
+        return line.decode("utf-8", "replace")
+
+    def _read_reply(self) -> str:
+        """Collect one %begin/%end (or %error) framed reply body."""
+        body: List[str] = []
+        guard: Optional[List[str]] = None
+        failed = False
+        while True:
+            line = self._readline()
+            if guard is None:
+                # Skip asynchronous notifications (%output, %session-changed...)
+                if line.startswith("%begin "):
+                    # "%begin <time> <number> <flags>": the number tags
+                    # the matching %end/%error, so captured pane text
+                    # that merely looks like a terminator can't end the
+                    # block early
+                    guard = line.split(" ")[2:3]
+                continue
+            if line.startswith(("%end ", "%error ")):
+                if line.split(" ")[2:3] == guard:
+                    failed = line.startswith("%error ")
+                    break
+            body.append(line)
+        output = "\n".join(body)
+        if failed:
+            raise subprocess.CalledProcessError(1, ["tmux"], output=output)
+        return output
+
+
 class TmuxManager:
     """Manages tmux session for Agent Arcade."""
 
@@ -39,6 +317,24 @@ class TmuxManager:
         self.agent_selected = False  # True once user selects an agent from menu
         self.current_game = None
 
+        # FIFO signalled by the pane-died hook (event-driven pane monitoring)
+        self._pane_event_path: Optional[Path] = None
+        self._pane_event_fd: Optional[int] = None
+
+        # Persistent control-mode client (spawned lazily once the session
+        # exists); one-shot subprocess calls remain the fallback
+        self._ctrl: Optional[_ControlModeClient] = None
+        self._ctrl_failed = False
+        self._ctrl_lock = threading.Lock()
+
+        # Last state published to the status bar, to skip redundant updates
+        self._last_status_key = None
+
+        # Memoized shell-quoted working directory (stable across the
+        # repeated agent launches the restart loop performs)
+        self._last_wd: Optional[Path] = None
+        self._last_wd_quoted: Optional[str] = None
+
         # Check tmux availability
         if not self._is_tmux_available():
             install_hint = "Install tmux with your system package manager."
@@ -68,6 +364,11 @@ class TmuxManager:
         """
         is_dev = get_data_dir() == ".agent-arcade-dev"
         if is_dev:
+            # Exec the venv interpreter directly when it can be resolved;
+            # poetry run re-imports poetry machinery on every launch
+            dev_python = _resolve_dev_python()
+            if dev_python:
+                return f"{shlex.quote(dev_python)} -m {module}"
             return f"export PATH=\"/Users/anthonygore/.local/bin:$PATH\" && poetry run python -m {module}"
         else:
             # Use the same Python interpreter that's running this code
@@ -81,15 +382,9 @@ class TmuxManager:
         Returns:
             True if tmux is available
         """
-        try:
-            subprocess.run(
-                ["tmux", "-V"],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        # PATH lookup (a few stat calls, cached in _tmux_bin) instead of
+        # spawning "tmux -V" on every manager construction
+        return _tmux_bin() is not None
 
     def create_session(self, working_dir: Optional[Path] = None) -> None:
         """
@@ -102,81 +397,100 @@ class TmuxManager:
         Args:
             working_dir: Working directory for session
         """
-        # Kill existing session if present
-        self._kill_session_if_exists()
+        # Kill existing session if present (drops any stale control client).
+        # kill-session already tolerates a missing session, so no
+        # has-session probe is needed first.
+        self.kill_session()
 
         # Build create session command for AI window
-        cmd = ["tmux", "new-session", "-d", "-s", self.session_name, "-n", "AI Agent"]
+        create_cmd = ["new-session", "-d", "-s", self.session_name, "-n", "AI Agent"]
 
         if working_dir:
-            cmd.extend(["-c", str(working_dir)])
+            create_cmd.extend(["-c", str(working_dir)])
+
+        # Create the session, second window for games, and all session
+        # options in a single tmux invocation: the session does not exist
+        # yet so the control pipe cannot help, and ';' separators collapse
+        # the serial fork/execs on this startup path into one. Windows are
+        # addressed by index throughout, so no pane IDs need parsing back.
+        cmds = [create_cmd]
+        cmds.append([
+            "new-window", "-t", f"{self.session_name}:{self.game_window_index}",
+            "-n", "Games"
+        ])
+        cmds.extend(self._configuration_cmds())
 
-        # Create new detached session with first window (AI)
-        subprocess.run(cmd, check=True)
+        argv: List[str] = []
+        for cmd in cmds:
+            if argv:
+                argv.append(";")
+            argv.extend(cmd)
+        _run(_tmux_argv(argv), check=True, **_TMUX_RUN_KW)
 
-        # Create second window for games
-        subprocess.run([
-            "tmux", "new-window", "-t", f"{self.session_name}:{self.game_window_index}",
-            "-n", "Games"
-        ], check=True)
+        # Set up initial status bar
+        if self.config.tmux.status_bar:
+            self.update_status_bar()
+
+    def _configuration_cmds(self) -> List[List[str]]:
+        """
+        Build the session option and key binding commands.
 
-        # Configure session
-        self._configure_session()
+        Returns:
+            List of tmux command argument lists
+        """
+        t = self.session_name
+        cmds: List[List[str]] = []
+
+        # Keep dead panes around instead of closing their windows: the
+        # pane monitors rely on #{pane_dead} and the pane-died hook
+        # (neither fires without remain-on-exit) and respawn the pane.
+        # Window option, so it must target each window, not the session.
+        for window_index in (self.ai_window_index, self.game_window_index):
+            cmds.append([
+                "set-option", "-t", f"{t}:{window_index}",
+                "remain-on-exit", "on",
+            ])
 
-    def _configure_session(self) -> None:
-        """Set tmux session options."""
         # Enable mouse mode if configured
+        # Users can hold Shift to select text in tmux even with mouse mode on
         if self.config.tmux.mouse_mode:
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "mouse", "on"])
-            self._configure_mouse_bindings()
+            cmds.append(["set-option", "-t", t, "mouse", "on"])
+            cmds.extend(self._mouse_binding_cmds())
         else:
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "mouse", "off"])
+            cmds.append(["set-option", "-t", t, "mouse", "off"])
 
         # Configure status bar
         if self.config.tmux.status_bar:
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "status", "2"])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "status-position", "bottom"])
+            cmds.append(["set-option", "-t", t, "status", "2"])
+            cmds.append(["set-option", "-t", t, "status-position", "bottom"])
             # Set status bar to fill width
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "status-left-length", "100"])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "status-right-length", "100"])
+            cmds.append(["set-option", "-t", t, "status-left-length", "100"])
+            cmds.append(["set-option", "-t", t, "status-right-length", "100"])
             # Hide window list
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "window-status-current-format", ""])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "window-status-format", ""])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "window-status-separator", ""])
+            cmds.append(["set-option", "-t", t, "window-status-current-format", ""])
+            cmds.append(["set-option", "-t", t, "window-status-format", ""])
+            cmds.append(["set-option", "-t", t, "window-status-separator", ""])
             # Initialize tmux variables
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "@selected-agent", ""])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "@current-game", ""])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "@game-keys", ""])
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "@agent-status", "🤖 No agent selected"])
-            # Set up initial status bar
-            self.update_status_bar()
+            cmds.append(["set-option", "-t", t, "@selected-agent", ""])
+            cmds.append(["set-option", "-t", t, "@current-game", ""])
+            cmds.append(["set-option", "-t", t, "@game-keys", ""])
+            cmds.append(["set-option", "-t", t, "@agent-status", "🤖 No agent selected"])
         else:
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "status", "off"])
+            cmds.append(["set-option", "-t", t, "status", "off"])
 
         # Bind Ctrl+Space to toggle between windows (last-window command)
         # Using -n flag to bind in root table (no prefix needed)
-        toggle_key = self.config.keybindings.toggle_window
-
-        # Simple approach: just toggle windows, mouse mode handled separately
-        self._send_tmux_cmd([
-            "bind-key", "-n", toggle_key, "last-window"
+        cmds.append([
+            "bind-key", "-n", self.config.keybindings.toggle_window, "last-window"
         ])
 
-        # If mouse mode is enabled, keep it on globally
-        # Users can hold Shift to select text in tmux even with mouse mode on
-        if self.config.tmux.mouse_mode:
-            self._send_tmux_cmd([
-                "set-option", "-t", self.session_name, "mouse", "on"
-            ])
-            self._configure_mouse_bindings()
-
         # Bind Ctrl+x to exit application (kill session)
-        # Using -n flag to bind in root table (no prefix needed)
-        exit_key = self.config.keybindings.exit_app
-        self._send_tmux_cmd([
-            "bind-key", "-n", exit_key, "kill-session"
+        cmds.append([
+            "bind-key", "-n", self.config.keybindings.exit_app, "kill-session"
         ])
 
+        return cmds
+
     def launch_ai_agent(
         self,
         agent_command: str,
@@ -199,9 +513,13 @@ class TmuxManager:
         # Build full command
         full_command = f"{agent_command} {' '.join(args)}".strip()
 
-        # Add cd command if working directory specified
+        # Add cd command if working directory specified; the quoted form
+        # is memoized since the directory is stable across relaunches
         if working_dir:
-            full_command = f"cd {shlex.quote(str(working_dir))} && {full_command}"
+            if working_dir != self._last_wd:
+                self._last_wd = working_dir
+                self._last_wd_quoted = shlex.quote(str(working_dir))
+            full_command = f"cd {self._last_wd_quoted} && {full_command}"
 
         # Wrap in restart loop so Ctrl+C or exits restart the process
         wrapped = self._wrap_restart_command(
@@ -282,20 +600,14 @@ class TmuxManager:
             True if pane is dead
         """
         try:
-            result = subprocess.run(
-                [
-                    "tmux",
-                    "list-panes",
-                    "-t",
-                    f"{self.session_name}:{window_index}",
-                    "-F",
-                    "#{pane_dead}",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip() == "1"
+            output = self._run_tmux([
+                "list-panes",
+                "-t",
+                f"{self.session_name}:{window_index}",
+                "-F",
+                "#{pane_dead}",
+            ])
+            return output.strip() == "1"
         except subprocess.CalledProcessError:
             return False
 
@@ -307,17 +619,13 @@ class TmuxManager:
             window_index: Window index to respawn
             command: Command string to run
         """
-        subprocess.run(
-            [
-                "tmux",
-                "respawn-pane",
-                "-t",
-                f"{self.session_name}:{window_index}",
-                "-k",
-                command,
-            ],
-            check=True,
-        )
+        self._send_tmux_cmd([
+            "respawn-pane",
+            "-t",
+            f"{self.session_name}:{window_index}",
+            "-k",
+            command,
+        ])
 
     def _wrap_restart_command(
         self,
@@ -383,36 +691,129 @@ class TmuxManager:
         target = f"{self.session_name}:{window_index}"
 
         if literal:
-            subprocess.run([
-                "tmux", "send-keys", "-t", target, "-l", command
-            ], check=True)
+            self._send_tmux_cmd([
+                "send-keys", "-t", target, "-l", command
+            ])
         else:
-            subprocess.run([
-                "tmux", "send-keys", "-t", target, command, "Enter"
-            ], check=True)
+            self._send_tmux_cmd([
+                "send-keys", "-t", target, command, "Enter"
+            ])
 
-    def capture_window_output(self, window_index: int, lines: int = 50) -> str:
+    def capture_window_output(
+        self,
+        window_index: int,
+        lines: int = 50,
+        tail_bytes: Optional[int] = None,
+        include_escapes: bool = False
+    ) -> str:
         """
         Capture recent output from window.
 
+        Escape sequences inflate colored captures by 20-40% and every
+        consumer here strips them anyway, so they are opt-in.
+
         Args:
             window_index: Window to capture (0 for AI, 1 for games)
             lines: Number of lines of history to capture
+            tail_bytes: If set, decode and return only the last N bytes
+                of the capture instead of the full text
+            include_escapes: If True, keep ANSI escape sequences (-e)
 
         Returns:
             String containing window content
         """
+        if tail_bytes is not None:
+            # Grab raw bytes and decode only the tail the caller scans
+            data = self.capture_window_bytes(
+                window_index, lines, include_escapes=include_escapes
+            )
+            return data[-tail_bytes:].decode("utf-8", "replace")
+
         target = f"{self.session_name}:{window_index}"
 
-        result = subprocess.run([
-            "tmux", "capture-pane", "-t", target,
+        args = [
+            "capture-pane", "-t", target,
             "-p",  # Print to stdout
             "-S", f"-{lines}",  # Start from N lines back
-            "-e"  # Include escape sequences
-        ], capture_output=True, text=True, check=True)
+        ]
+        if include_escapes:
+            args.append("-e")
+        return self._run_tmux(args)
+
+    def capture_window_bytes(
+        self,
+        window_index: int,
+        lines: int = 50,
+        include_escapes: bool = False
+    ) -> bytes:
+        """
+        Capture recent output from window as raw bytes.
+
+        Skips the full UTF-8 decode so callers that only look at the tail
+        of the buffer can decode just what they scan.
+
+        Args:
+            window_index: Window to capture (0 for AI, 1 for games)
+            lines: Number of lines of history to capture
+            include_escapes: If True, keep ANSI escape sequences (-e)
+
+        Returns:
+            Raw bytes of window content
+        """
+        target = f"{self.session_name}:{window_index}"
+
+        args = [
+            "capture-pane", "-t", target, "-p", "-S", f"-{lines}"
+        ]
+        if include_escapes:
+            args.append("-e")
+
+        # Through the control pipe the capture is already text; encoding it
+        # back still beats paying a fork/exec for the one-shot client
+        ctrl = self._control_client()
+        if ctrl is not None:
+            try:
+                return ctrl.run(args).encode("utf-8")
+            except subprocess.CalledProcessError:
+                raise
+            except Exception:
+                with self._ctrl_lock:
+                    self._ctrl = None
+
+        result = _run(
+            _tmux_argv(args), check=True, **_TMUX_CAPTURE_KW
+        )
 
         return result.stdout
 
+    def pipe_window_output(self, window_index: int, shell_command: str) -> None:
+        """
+        Pipe new pane output to a shell command (tmux pipe-pane).
+
+        Args:
+            window_index: Window to pipe (0 for AI, 1 for games)
+            shell_command: Shell command receiving the output on stdin
+        """
+        self._send_tmux_cmd([
+            "pipe-pane", "-o", "-t", f"{self.session_name}:{window_index}",
+            shell_command,
+        ])
+
+    def stop_window_pipe(self, window_index: int) -> None:
+        """
+        Stop piping pane output started by pipe_window_output.
+
+        Args:
+            window_index: Window to stop piping
+        """
+        try:
+            self._send_tmux_cmd([
+                "pipe-pane", "-t", f"{self.session_name}:{window_index}"
+            ])
+        except Exception:
+            # Session may already be gone during shutdown
+            pass
+
     def get_active_window_index(self) -> int:
         """
         Get the currently active window index.
@@ -421,40 +822,91 @@ class TmuxManager:
             Window index (0 for AI, 1 for games)
         """
         try:
-            result = subprocess.run([
-                "tmux", "display-message", "-t", self.session_name,
+            output = self._run_tmux([
+                "display-message", "-t", self.session_name,
                 "-p", "#{window_index}"
-            ], capture_output=True, text=True, check=True)
-            return int(result.stdout.strip())
+            ])
+            return int(output.strip())
         except (subprocess.CalledProcessError, ValueError):
             return -1
 
     def attach(self) -> None:
         """Attach to tmux session (blocking)."""
-        # Focus on AI window first
-        subprocess.run([
-            "tmux", "select-window", "-t", f"{self.session_name}:{self.ai_window_index}"
-        ], check=True)
+        # Focus the AI window and attach in one tmux client; the ';'
+        # separator saves a fork/exec on the user-facing attach latency.
+        # The client must keep the tty, so no fd redirection here.
+        _run(_tmux_argv([
+            "select-window", "-t", f"{self.session_name}:{self.ai_window_index}",
+            ";",
+            "attach-session", "-t", self.session_name
+        ]), check=True, close_fds=False)
+
+    def register_pane_died_event(self) -> Optional[int]:
+        """
+        Register a pane-died hook that signals a FIFO.
 
-        # Attach to session
-        subprocess.run([
-            "tmux", "attach-session", "-t", self.session_name
-        ], check=True)
+        Lets pane monitors block on the FIFO instead of polling
+        list-panes every second.
 
-    def kill_session(self) -> None:
-        """Terminate tmux session."""
-        subprocess.run([
-            "tmux", "kill-session", "-t", self.session_name
-        ], check=False)  # Don't fail if session doesn't exist
+        Returns:
+            Read file descriptor for the FIFO, or None if unavailable
+        """
+        path = Path(tempfile.gettempdir()) / f"agent-arcade-dead-{os.getpid()}.fifo"
+        try:
+            if path.exists():
+                path.unlink()
+            os.mkfifo(path)
+            # O_RDWR keeps our own write end open, so the FIFO never
+            # reaches EOF when the hook's short-lived writers close —
+            # an EOF'd FIFO reports readable forever and would turn the
+            # select()-based waiters into busy loops
+            fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+            # Window-scoped hooks: a session-scoped pane-died hook only
+            # fires for panes in the session's current window, and the
+            # monitored AI pane usually is not current
+            self._send_tmux_cmds([
+                [
+                    "set-hook", "-w",
+                    "-t", f"{self.session_name}:{window_index}",
+                    "pane-died",
+                    f"run-shell \"echo died >> {path}\"",
+                ]
+                for window_index in (self.ai_window_index, self.game_window_index)
+            ])
+            self._pane_event_path = path
+            self._pane_event_fd = fd
+            return fd
+        except Exception:
+            self.close_pane_died_event()
+            try:
+                if path.exists():
+                    path.unlink()
+            except OSError:
+                pass
+            return None
 
-    def _kill_session_if_exists(self) -> None:
-        """Kill session if it already exists."""
-        result = subprocess.run([
-            "tmux", "has-session", "-t", self.session_name
-        ], capture_output=True)
+    def close_pane_died_event(self) -> None:
+        """Close and remove the pane-died FIFO."""
+        if self._pane_event_fd is not None:
+            try:
+                os.close(self._pane_event_fd)
+            except OSError:
+                pass
+            self._pane_event_fd = None
+        if self._pane_event_path:
+            try:
+                self._pane_event_path.unlink()
+            except OSError:
+                pass
+            self._pane_event_path = None
 
-        if result.returncode == 0:
-            self.kill_session()
+    def kill_session(self) -> None:
+        """Terminate tmux session."""
+        self._close_control_client()
+        _run(_tmux_argv([
+            "kill-session", "-t", self.session_name
+        ]), check=False, **_TMUX_RUN_KW)  # Don't fail if session doesn't exist
+        self.close_pane_died_event()
 
     def set_agent_state(self, is_idle: bool) -> None:
         """
@@ -486,9 +938,6 @@ class TmuxManager:
         selected_agent = self.get_session_option("@selected-agent")
         agent_is_selected = bool(selected_agent)
 
-        # Ensure mouse wheel scrolls tmux buffer in Codex TUI
-        self._apply_mouse_mode(selected_agent)
-
         # Determine agent status text and color
         if not agent_is_selected:
             agent_status = "🤖 No agent selected"
@@ -500,15 +949,25 @@ class TmuxManager:
             agent_status = "🤖 Agent working..."
             status_color = "orange"
 
+        # Skip the tmux round-trips when this exact state is already
+        # published (state flaps during streaming hit this path a lot)
+        status_key = (selected_agent, agent_status, status_color)
+        if status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
+
+        # Ensure mouse wheel scrolls tmux buffer in Codex TUI
+        cmds = self._apply_mouse_mode(selected_agent)
+
         # Store agent status in tmux variable for dynamic display
-        self._send_tmux_cmd([
+        cmds.append([
             "set-option", "-t", self.session_name,
             "@agent-status",
             agent_status,
         ])
 
         # Update status bar background color only
-        self._send_tmux_cmd([
+        cmds.append([
             "set-option", "-t", self.session_name,
             "status-style",
             f"bg={status_color},fg=black",
@@ -540,35 +999,156 @@ class TmuxManager:
             "#[default]"
         )
 
-        self._send_tmux_cmd([
+        cmds.append([
             "set-option", "-t", self.session_name,
             "status-format[0]",
             top_format,
         ])
-        self._send_tmux_cmd([
+        cmds.append([
             "set-option", "-t", self.session_name,
             "status-format[1]",
             bottom_format,
         ])
 
-    def _send_tmux_cmd(self, args: List[str]) -> None:
+        # One round-trip for the whole status refresh
+        self._send_tmux_cmds(cmds)
+
+    def _control_client(self) -> Optional[_ControlModeClient]:
         """
-        Send arbitrary tmux command.
+        Return the persistent control-mode client, spawning it lazily.
+
+        Returns:
+            Client instance, or None if control mode is unavailable
+        """
+        with self._ctrl_lock:
+            if self._ctrl is not None and self._ctrl.alive():
+                return self._ctrl
+            self._ctrl = None
+            if self._ctrl_failed:
+                return None
+            try:
+                self._ctrl = _ControlModeClient(self.session_name)
+                return self._ctrl
+            except Exception:
+                self._ctrl_failed = True
+                return None
+
+    def _close_control_client(self) -> None:
+        """Close the control-mode client and allow a later respawn."""
+        with self._ctrl_lock:
+            if self._ctrl is not None:
+                self._ctrl.close()
+                self._ctrl = None
+            self._ctrl_failed = False
+
+    def _run_tmux(self, args: List[str], capture: bool = True) -> str:
+        """
+        Run a tmux command, preferring the control-mode pipe.
 
         Args:
-            args: Command arguments
+            args: Command arguments (without the leading "tmux")
+            capture: Whether the fallback path must capture output; when
+                False it can use the cheaper posix_spawn launch
+
+        Returns:
+            Command stdout (empty for the no-capture fallback)
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails
         """
+        # The control-mode protocol is line-based; anything with embedded
+        # newlines has to go through a one-shot client
+        if not any("\n" in arg for arg in args):
+            ctrl = self._control_client()
+            if ctrl is not None:
+                try:
+                    return ctrl.run(args)
+                except subprocess.CalledProcessError:
+                    raise
+                except Exception:
+                    # Broken pipe or timeout: drop the client and fall back
+                    with self._ctrl_lock:
+                        self._ctrl = None
+
+        if not capture and hasattr(os, "posix_spawn"):
+            _spawn_tmux_and_wait(args)
+            return ""
+
+        result = _run(
+            _tmux_argv(args),
+            check=True,
+            text=True,
+            **_TMUX_CAPTURE_KW,
+        )
+        return result.stdout
+
+    def _send_tmux_cmds(self, cmds: List[List[str]]) -> None:
+        """
+        Send several tmux commands in one invocation.
+
+        The batch costs a single control-mode write (one line per
+        command), or one fork with ';' separators on the fallback path,
+        instead of one invocation per command.
+
+        Args:
+            cmds: List of command argument lists
+        """
+        if not cmds:
+            return
+        if len(cmds) == 1:
+            self._send_tmux_cmd(cmds[0])
+            return
+
         try:
-            result = subprocess.run(
-                ["tmux"] + args,
+            if not any("\n" in arg for cmd in cmds for arg in cmd):
+                ctrl = self._control_client()
+                if ctrl is not None:
+                    lines = [
+                        " ".join(_quote_tmux_arg(a) for a in cmd) for cmd in cmds
+                    ]
+                    try:
+                        ctrl.run_lines(lines)
+                        return
+                    except subprocess.CalledProcessError:
+                        raise
+                    except Exception:
+                        with self._ctrl_lock:
+                            self._ctrl = None
+
+            # One-shot fallback: tmux treats a lone ";" argument as a
+            # command separator
+            argv: List[str] = []
+            for cmd in cmds:
+                if argv:
+                    argv.append(";")
+                argv.extend(cmd)
+            _run(
+                _tmux_argv(argv),
                 check=True,
-                capture_output=True,
                 text=True,
+                **_TMUX_CAPTURE_KW,
             )
-            if result.stdout:
-                logger.debug("tmux stdout: %s", result.stdout.strip())
-            if result.stderr:
-                logger.debug("tmux stderr: %s", result.stderr.strip())
+        except subprocess.CalledProcessError as exc:
+            logger.error("tmux command batch failed: %s", cmds)
+            if exc.stdout:
+                logger.error("tmux stdout: %s", exc.stdout.strip())
+            if exc.stderr:
+                logger.error("tmux stderr: %s", exc.stderr.strip())
+            raise
+
+    def _send_tmux_cmd(self, args: List[str]) -> None:
+        """
+        Send arbitrary tmux command.
+
+        Args:
+            args: Command arguments
+        """
+        try:
+            # Output is only logged at debug level, so the fallback can
+            # use the no-capture fast path
+            output = self._run_tmux(args, capture=False)
+            if output:
+                logger.debug("tmux stdout: %s", output.strip())
         except subprocess.CalledProcessError as exc:
             logger.error("tmux command failed: %s", ["tmux"] + args)
             if exc.stdout:
@@ -577,45 +1157,54 @@ class TmuxManager:
                 logger.error("tmux stderr: %s", exc.stderr.strip())
             raise
 
-    def _configure_mouse_bindings(self) -> None:
-        """Configure mouse bindings so scroll selects tmux buffer, not app input."""
-        # Scroll wheel enters copy-mode (if needed) and scrolls the pane.
-        self._send_tmux_cmd([
-            "bind-key", "-n", "WheelUpPane",
-            "if-shell", "-F", "#{pane_in_mode}",
-            "send-keys -X scroll-up",
-            "copy-mode -e; send-keys -X scroll-up",
-        ])
-        self._send_tmux_cmd([
-            "bind-key", "-n", "WheelDownPane",
-            "if-shell", "-F", "#{pane_in_mode}",
-            "send-keys -X scroll-down",
-            "copy-mode -e; send-keys -X scroll-down",
-        ])
-        # Mouse drag selects text in copy-mode.
-        self._send_tmux_cmd([
-            "bind-key", "-n", "MouseDrag1Pane",
-            "if-shell", "-F", "#{pane_in_mode}",
-            "send-keys -X drag-to-selection",
-            "copy-mode -e; send-keys -X begin-selection; send-keys -X drag-to-selection",
-        ])
+    def _mouse_binding_cmds(self) -> List[List[str]]:
+        """
+        Build mouse bindings so scroll selects tmux buffer, not app input.
 
-    def _apply_mouse_mode(self, selected_agent: Optional[str]) -> None:
+        Returns:
+            List of tmux command argument lists
         """
-        Set mouse mode based on selected agent and config.
+        return [
+            # Scroll wheel enters copy-mode (if needed) and scrolls the pane.
+            [
+                "bind-key", "-n", "WheelUpPane",
+                "if-shell", "-F", "#{pane_in_mode}",
+                "send-keys -X scroll-up",
+                "copy-mode -e; send-keys -X scroll-up",
+            ],
+            [
+                "bind-key", "-n", "WheelDownPane",
+                "if-shell", "-F", "#{pane_in_mode}",
+                "send-keys -X scroll-down",
+                "copy-mode -e; send-keys -X scroll-down",
+            ],
+            # Mouse drag selects text in copy-mode.
+            [
+                "bind-key", "-n", "MouseDrag1Pane",
+                "if-shell", "-F", "#{pane_in_mode}",
+                "send-keys -X drag-to-selection",
+                "copy-mode -e; send-keys -X begin-selection; send-keys -X drag-to-selection",
+            ],
+        ]
+
+    def _apply_mouse_mode(self, selected_agent: Optional[str]) -> List[List[str]]:
+        """
+        Build mouse mode commands based on selected agent and config.
 
         Codex's TUI scrolls input history on mouse wheel, so keep tmux mouse on
         to intercept wheel events and scroll the pane instead.
+
+        Returns:
+            List of tmux command argument lists
         """
         if selected_agent == "codex":
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "mouse", "on"])
-            self._configure_mouse_bindings()
-            return
+            cmds = [["set-option", "-t", self.session_name, "mouse", "on"]]
+            cmds.extend(self._mouse_binding_cmds())
+            return cmds
 
         if self.config.tmux.mouse_mode:
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "mouse", "on"])
-        else:
-            self._send_tmux_cmd(["set-option", "-t", self.session_name, "mouse", "off"])
+            return [["set-option", "-t", self.session_name, "mouse", "on"]]
+        return [["set-option", "-t", self.session_name, "mouse", "off"]]
 
     def get_session_option(self, option: str) -> Optional[str]:
         """
@@ -628,20 +1217,14 @@ class TmuxManager:
             Option value or None if unavailable
         """
         try:
-            result = subprocess.run(
-                [
-                    "tmux",
-                    "display-message",
-                    "-t",
-                    self.session_name,
-                    "-p",
-                    f"#{{{option}}}",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            value = result.stdout.strip()
+            output = self._run_tmux([
+                "display-message",
+                "-t",
+                self.session_name,
+                "-p",
+                f"#{{{option}}}",
+            ])
+            value = output.strip()
             return value if value else None
         except (subprocess.CalledProcessError, FileNotFoundError):
             return None
@@ -46,7 +46,8 @@ class AgentSelectorScreen(BaseSelectorScreen):
             table: DataTable to populate
         """
         if not self.config.agents:
-            table.add_row(
+            self.add_item_row(
+                table,
                 Text("No agents configured", style="italic red"),
                 Text("Check your config", style="italic red"),
                 key="none"
@@ -59,7 +60,8 @@ class AgentSelectorScreen(BaseSelectorScreen):
             if len(command) > 60:
                 command = command[:57] + "..."
 
-            table.add_row(
+            self.add_item_row(
+                table,
                 Text(agent_config.name, style="italic #03AC13"),
                 Text(command, style="italic #03AC13"),
                 key=agent_id
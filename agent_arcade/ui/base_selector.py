@@ -1,5 +1,7 @@
 """Base selector screen for Agent Arcade menus."""
 
+from typing import List, Optional
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.screen import Screen
@@ -57,6 +59,13 @@ class BaseSelectorScreen(Screen):
 
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Row keys by table row index, so hot actions resolve the item
+        # under the cursor with a list index instead of walking Textual's
+        # internal coordinate maps
+        self._row_keys: List[str] = []
+
     @property
     def TITLE(self) -> str:
         """Return the screen title. Override in subclass."""
@@ -98,16 +107,55 @@ class BaseSelectorScreen(Screen):
         """
         raise NotImplementedError("Subclass must implement on_item_selected()")
 
+    def add_item_row(self, table: DataTable, *cells, key: str) -> None:
+        """
+        Add a keyed row and record its key for cursor lookups.
+
+        Args:
+            table: DataTable to add to
+            cells: Cell values for the row
+            key: Item ID used as the row key
+        """
+        table.add_row(*cells, key=key)
+        self._row_keys.append(key)
+
+    def clear_item_rows(self, table: DataTable) -> None:
+        """
+        Clear the table and the recorded row keys.
+
+        Args:
+            table: DataTable to clear
+        """
+        table.clear()
+        self._row_keys.clear()
+
+    def _current_item_id(self) -> Optional[str]:
+        """
+        Resolve the item ID under the table cursor.
+
+        Returns:
+            Item ID, or None if no row is selected
+        """
+        table = self.query_one(DataTable)
+        row = table.cursor_row
+        if row is None:
+            return None
+        if 0 <= row < len(self._row_keys):
+            return self._row_keys[row]
+        # Fallback for rows added without add_item_row
+        cursor_key = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return cursor_key.row_key.value if cursor_key.row_key else None
+
     def compose(self) -> ComposeResult:
         """Compose UI layout."""
         yield Header()
         with Container(id="selector-wrapper"):
             with Horizontal(id="selector-columns"):
-                # Create item table
+                # Create item table; rows are filled in on_mount so the
+                # chrome paints before the list is enumerated
                 table = DataTable(cursor_type="row", id="item-table")
                 columns = self.get_table_columns()
                 table.add_columns(*columns)
-                self.populate_table(table)
 
                 # Instructions column
                 with Container(id="instructions-column"):
@@ -118,8 +166,10 @@ class BaseSelectorScreen(Screen):
                     yield table
 
     def on_mount(self) -> None:
-        """Focus the table when screen mounts."""
+        """Populate and focus the table when screen mounts."""
         table = self.query_one(DataTable)
+        if not table.row_count:
+            self.populate_table(table)
         table.focus()
 
     def on_screen_resume(self) -> None:
@@ -142,9 +192,6 @@ class BaseSelectorScreen(Screen):
 
     def action_select_item(self) -> None:
         """Select current item (bound to enter key)."""
-        table = self.query_one(DataTable)
-        if table.cursor_row is not None:
-            cursor_key = table.coordinate_to_cell_key(table.cursor_coordinate)
-            if cursor_key.row_key:
-                item_id = cursor_key.row_key.value
-                self.on_item_selected(item_id)
+        item_id = self._current_item_id()
+        if item_id is not None:
+            self.on_item_selected(item_id)
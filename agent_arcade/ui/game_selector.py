@@ -21,8 +21,33 @@ class GameSelectorScreen(BaseSelectorScreen):
         super().__init__()
         self.library = library
         self.games = library.list_games(sort_by="name")
+        self._rows = self._build_rows()
         self.selected_game_id: str = None
 
+    def _build_rows(self) -> list:
+        """
+        Materialize (id, name, description) row tuples for the table.
+
+        Built once per game-list load so populate_table does plain tuple
+        unpacking instead of attribute lookups and Text styling per row.
+
+        Returns:
+            List of (game_id, styled name, styled description) tuples
+        """
+        rows = []
+        for game_meta in self.games:
+            # Truncate description to max 60 chars
+            description = str(game_meta.description)
+            if len(description) > 60:
+                description = description[:57] + "..."
+
+            rows.append((
+                game_meta.id,
+                Text(str(game_meta.name), style="italic #03AC13"),
+                Text(description, style="italic #03AC13"),
+            ))
+        return rows
+
     def get_instructions(self) -> str:
         """Return instructions text."""
         return (
@@ -42,17 +67,8 @@ class GameSelectorScreen(BaseSelectorScreen):
         Args:
             table: DataTable to populate
         """
-        for game_meta in self.games:
-            # Truncate description to max 60 chars
-            description = str(game_meta.description)
-            if len(description) > 60:
-                description = description[:57] + "..."
-
-            table.add_row(
-                Text(str(game_meta.name), style="italic #03AC13"),
-                Text(description, style="italic #03AC13"),
-                key=game_meta.id
-            )
+        for game_id, name, description in self._rows:
+            self.add_item_row(table, name, description, key=game_id)
 
     def on_item_selected(self, item_id: str) -> None:
         """
@@ -67,6 +83,11 @@ class GameSelectorScreen(BaseSelectorScreen):
     def refresh_games(self) -> None:
         """Reload the game list and refresh the table."""
         self.games = self.library.list_games(sort_by="name")
+        self._rows = self._build_rows()
         table = self.query_one(DataTable)
-        table.clear()
-        self.populate_table(table)
+        # Rows need per-row keys (add_rows cannot set them), so instead
+        # suppress repaints while clear + add_row rebuild the table and
+        # let Textual paint the whole diff once
+        with self.app.batch_update():
+            self.clear_item_rows(table)
+            self.populate_table(table)